@@ -1,28 +1,16 @@
-import csv
+import pandas as pd
 
-# 1. Open the file in read mode
-with open("student_marks.csv", "r") as file:
-    reader = csv.DictReader(file)  # Reads CSV into a list of dictionaries
+# 1. Open the file and read it into a DataFrame
+students = pd.read_csv("student_marks.csv")
 
-    # 2. Create a list of dictionaries from the given data
-    students = list(reader)
+# 2. Every column other than Name and RollNo is a subject
+subjects = [col for col in students.columns if col not in ["Name", "RollNo"]]
 
-# 3 & 4. Add 'total_marks' and 'Average' fields
-for student in students:
-    # Convert all subject marks to integers
-    marks = [int(student[subj]) for subj in student if subj not in ["Name", "RollNo"]]
-    total = sum(marks)
-    average = total / len(marks)
-
-    student["total_marks"] = total
-    student["Average"] = round(average, 2)  # round to 2 decimal places
+# 3 & 4. Add 'total_marks' and 'Average' columns
+students["total_marks"] = students[subjects].sum(axis=1)
+students["Average"] = (students["total_marks"] / len(subjects)).round(2)  # round to 2 decimal places
 
 # 5. Create a new file and write updated data
-fieldnames = list(students[0].keys())  # All columns including new ones
-
-with open("student_marks_updated.csv", "w", newline="") as new_file:
-    writer = csv.DictWriter(new_file, fieldnames=fieldnames)
-    writer.writeheader()  # Write the first row (column names)
-    writer.writerows(students)  # Write all student data
+students.to_csv("student_marks_updated.csv", index=False, lineterminator="\r\n")
 
 print("✅ New file 'student_marks_updated.csv' created successfully!")
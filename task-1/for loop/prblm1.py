@@ -1,31 +1,21 @@
-import random
+import numpy as np
 
-# Variables to keep track of counts
-count_6 = 0
-count_1 = 0
-count_two_6s_row = 0
+N = 20  # Roll the die at least 20 times
 
-previous_roll = 0  # To track the last roll
+# Simulate all dice rolls at once
+rolls = np.random.randint(1, 7, size=N)
 
-# Roll the die at least 20 times 
-for i in range(20):
-    roll = random.randint(1, 6)  # Simulate dice roll
+for i, roll in enumerate(rolls):
     print(f"Roll {i+1}: {roll}")
 
-    # Count how many times you rolled a 6
-    if roll == 6:
-        count_6 += 1
+# Count how many times you rolled a 6
+count_6 = int((rolls == 6).sum())
 
-    # Count how many times you rolled a 1
-    if roll == 1:
-        count_1 += 1
+# Count how many times you rolled a 1
+count_1 = int((rolls == 1).sum())
 
-    # Count how many times you rolled two 6s in a row
-    if roll == 6 and previous_roll == 6:
-        count_two_6s_row += 1
-
-    # Update previous roll
-    previous_roll = roll
+# Count how many times you rolled two 6s in a row
+count_two_6s_row = int(((rolls[:-1] == 6) & (rolls[1:] == 6)).sum())
 
 # Print statistics
 print("\n--- Statistics ---")
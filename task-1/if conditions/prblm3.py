@@ -3,20 +3,20 @@ Australia = ["Sydney", "Melbourne", "Brisbane", "Perth"]
 UAE = ["Dubai", "Abu Dhabi", "Sharjah", "Ajman"]
 India = ["Mumbai", "Bangalore", "Chennai", "Delhi"]
 
+# Reverse lookup from each city to its country, built once
+city_to_country = (
+    {city: "Australia" for city in Australia}
+    | {city: "UAE" for city in UAE}
+    | {city: "India" for city in India}
+)
+
 # Ask user for two cities
 city1 = input("Enter the first city: ").strip()
 city2 = input("Enter the second city: ").strip()
 
 # Function to find country for a city
 def get_country(city):
-    if city in Australia:
-        return "Australia"
-    elif city in UAE:
-        return "UAE"
-    elif city in India:
-        return "India"
-    else:
-        return None
+    return city_to_country.get(city)
 
 # Get countries of both cities
 country1 = get_country(city1)
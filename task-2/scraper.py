@@ -1,43 +1,51 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, Tag
 import csv
+from itertools import chain
 
 url = "https://shadowfox.in/"
 
-try:
-    response = requests.get(url, timeout=10)
-    response.raise_for_status()
-
-    soup = BeautifulSoup(response.text, "html.parser")
-
-    # Scrape Headings
-    headings = [h.get_text(strip=True) for h in soup.find_all(["h1", "h2", "h3"])]
-
-    # Scrape Paragraphs
-    paragraphs = [p.get_text(strip=True) for p in soup.find_all("p")]
-
-    # Scrape Links
-    links = [a["href"] for a in soup.find_all("a", href=True)]
+# Reuse pooled keep-alive connections if more URLs are fetched
+session = requests.Session()
+adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+session.mount("http://", adapter)
+session.mount("https://", adapter)
 
-    # Scrape Images
-    images = [img["src"] for img in soup.find_all("img", src=True)]
+try:
+    # Stream the body straight into the parser instead of building response.text
+    with session.get(url, stream=True, timeout=10) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True  # undo gzip/deflate transfer encoding
+        soup = BeautifulSoup(response.raw, "lxml")
+
+    # Scrape headings, paragraphs, links and images in one walk over the page
+    headings, paragraphs, links, images = [], [], [], []
+    for el in soup.descendants:
+        if not isinstance(el, Tag):
+            continue
+        tag = el.name
+        if tag in ("h1", "h2", "h3"):
+            headings.append(el.get_text(strip=True))
+        elif tag == "p":
+            paragraphs.append(el.get_text(strip=True))
+        elif tag == "a" and el.has_attr("href"):
+            links.append(el["href"])
+        elif tag == "img" and el.has_attr("src"):
+            images.append(el["src"])
 
     # Save everything in CSV
-    with open("shadowfox_large_scrape.csv", "w", newline="", encoding="utf-8") as file:
+    rows = chain(
+        (("Heading", h) for h in headings),
+        (("Paragraph", p) for p in paragraphs),
+        (("Link", l) for l in links),
+        (("Image", img) for img in images),
+    )
+
+    with open("shadowfox_large_scrape.csv", "w", newline="", encoding="utf-8", buffering=1 << 20) as file:
         writer = csv.writer(file)
         writer.writerow(["Type", "Content"])
-
-        for h in headings:
-            writer.writerow(["Heading", h])
-
-        for p in paragraphs:
-            writer.writerow(["Paragraph", p])
-
-        for l in links:
-            writer.writerow(["Link", l])
-
-        for img in images:
-            writer.writerow(["Image", img])
+        writer.writerows(rows)
 
     print("✅ Large scraping completed! Data saved in shadowfox_large_scrape.csv")
 
@@ -7,8 +7,10 @@ user-defined weights.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict, Tuple
 
+import numpy as np
 import pandas as pd
 
 
@@ -24,6 +26,17 @@ class Weights:
 	WMRO: float = -1.0
 	WDH: float = 1.5
 
+	@cached_property
+	def vec(self) -> np.ndarray:
+		"""Weights as a vector in count-column order, built once per instance."""
+		return np.array(
+			[self.WCP, self.WGT, self.WC, self.WDC, self.WST, self.WRO, self.WMRO, self.WDH],
+			dtype=np.float64,
+		)
+
+
+_COUNT_COLUMNS = ["CP", "GT", "C", "DC", "ST", "RO", "MRO", "DH"]
+
 
 def compute_action_counts(df: pd.DataFrame) -> pd.DataFrame:
 	"""Compute per-player counts for each fielding action and runs saved.
@@ -32,40 +45,38 @@ def compute_action_counts(df: pd.DataFrame) -> pd.DataFrame:
 
 	Returns a DataFrame indexed by player with columns:
 	['CP','GT','C','DC','ST','RO','MRO','DH','RS']
+	Players appear in the order they first occur in `df`.
 	"""
-	# Normalize strings to lower for robust matching
-	working = df.copy()
-	for col in ["Pick", "Throw"]:
-		working[col] = working[col].fillna("").str.strip().str.lower()
-
-	# Map conditions
-	cp = (working["Pick"] == "clean pick").groupby(working["Player Name"]).sum()
-	gt = (working["Pick"] == "good throw").groupby(working["Player Name"]).sum()
-	c_catch = (working["Pick"] == "catch").groupby(working["Player Name"]).sum()
-	dc = (working["Pick"] == "drop catch").groupby(working["Player Name"]).sum()
-	st = (working["Throw"] == "stumping").groupby(working["Player Name"]).sum()
-	ro = (working["Throw"] == "run out").groupby(working["Player Name"]).sum()
-	mro = (working["Throw"] == "missed run out").groupby(working["Player Name"]).sum()
-	dh = (working["Short Description"].fillna("").str.lower().str.contains("direct hit")).groupby(working["Player Name"]).sum()
-
-	# Runs saved (positive saves, negative conceded). Sum as-is
-	rs = working.groupby("Player Name")["Runs"].sum()
-
-	# Combine to one DataFrame, fill missing with zeros
-	result = pd.concat(
-		[
-			cp.rename("CP"),
-			gt.rename("GT"),
-			c_catch.rename("C"),
-			dc.rename("DC"),
-			st.rename("ST"),
-			ro.rename("RO"),
-			mro.rename("MRO"),
-			dh.rename("DH"),
-			rs.rename("RS"),
-		],
-		axis=1,
-	).fillna(0).astype({"CP": int, "GT": int, "C": int, "DC": int, "ST": int, "RO": int, "MRO": int, "DH": int, "RS": float})
+	# Normalize strings to lower for robust matching; only the touched columns
+	# are materialized, never a copy of the whole frame.
+	pick = df["Pick"].fillna("").str.strip().str.lower().astype("category")
+	throw = df["Throw"].fillna("").str.strip().str.lower().astype("category")
+	desc = df["Short Description"].fillna("").str.lower()
+	players = df["Player Name"].astype("category")
+
+	# One boolean column per action, so a single groupby pass yields every count.
+	# Comparisons on the categorical columns run against integer codes.
+	flags = pd.DataFrame(
+		{
+			"CP": pick.eq("clean pick"),
+			"GT": pick.eq("good throw"),
+			"C": pick.eq("catch"),
+			"DC": pick.eq("drop catch"),
+			"ST": throw.eq("stumping"),
+			"RO": throw.eq("run out"),
+			"MRO": throw.eq("missed run out"),
+			"DH": desc.str.contains("direct hit", regex=False, na=False),
+			# Runs saved (positive saves, negative conceded). Sum as-is
+			"RS": df["Runs"],
+		}
+	)
+
+	result = (
+		flags.groupby(players, sort=False, observed=True)
+		.sum()
+		.astype({"CP": int, "GT": int, "C": int, "DC": int, "ST": int, "RO": int, "MRO": int, "DH": int, "RS": float})
+	)
+	result.index = result.index.astype(result.index.categories.dtype)
 
 	return result
 
@@ -79,17 +90,7 @@ def compute_ps(counts_df: pd.DataFrame, weights: Weights) -> pd.DataFrame:
 	Returns the input DataFrame with an added 'PS' column.
 	"""
 	df = counts_df.copy()
-	df["PS"] = (
-		df["CP"] * weights.WCP
-		+ df["GT"] * weights.WGT
-		+ df["C"] * weights.WC
-		+ df["DC"] * weights.WDC
-		+ df["ST"] * weights.WST
-		+ df["RO"] * weights.WRO
-		+ df["MRO"] * weights.WMRO
-		+ df["DH"] * weights.WDH
-		+ df["RS"]
-	)
+	df["PS"] = counts_df[_COUNT_COLUMNS].to_numpy() @ weights.vec + counts_df["RS"].to_numpy()
 	return df
 
 
@@ -29,6 +29,24 @@ REQUIRED_COLUMNS = [
 	"Venue",
 ]
 
+# Compact dtypes for CSV loading. Integers are nullable so blank cells still
+# load; Runs may be fractional; free-text and action columns stay strings so
+# they can be normalized.
+_CSV_DTYPES = {
+	"Match No.": "Int32",
+	"Innings": "Int8",
+	"Team": "category",
+	"Player Name": "category",
+	"Ballcount": "Int32",
+	"Position": "category",
+	"Short Description": "string",
+	"Pick": "string",
+	"Throw": "string",
+	"Runs": "Float32",
+	"Overcount": "string",
+	"Venue": "category",
+}
+
 
 def _ensure_parent_directory(path: str) -> None:
 	"""Create parent directories for a file path if they do not exist."""
@@ -82,14 +100,19 @@ def load_dataset(path: str) -> pd.DataFrame:
 	Raises
 	------
 	ValueError
-		If the file extension is unsupported or columns are missing.
+		If the file extension is unsupported, columns are missing, or a
+		column's values do not fit its expected type.
 	"""
 	if not os.path.exists(path):
 		raise ValueError(f"Dataset not found at: {path}")
 
 	_, ext = os.path.splitext(path.lower())
 	if ext == ".csv":
-		df = pd.read_csv(path)
+		# Only the required columns are parsed; any missing ones are reported below
+		try:
+			df = pd.read_csv(path, usecols=lambda c: c in REQUIRED_COLUMNS, dtype=_CSV_DTYPES)
+		except (TypeError, ValueError) as e:
+			raise ValueError(f"Dataset has values of an unexpected type: {e}") from e
 	elif ext in {".xlsx", ".xls"}:
 		df = pd.read_excel(path)
 	else:
@@ -107,7 +130,7 @@ def save_cleaned_data(df: pd.DataFrame, path: str) -> None:
 	_ensure_parent_directory(path)
 	_, ext = os.path.splitext(path.lower())
 	if ext == ".csv":
-		df.to_csv(path, index=False)
+		df.to_csv(path, index=False, chunksize=65536, lineterminator="\n")
 	elif ext in {".xlsx", ".xls"}:
 		df.to_excel(path, index=False)
 	else:
@@ -13,8 +13,10 @@ from __future__ import annotations
 import argparse
 import os
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 try:
@@ -24,6 +26,8 @@ try:
 except Exception:
 	_HAS_PLOTTING = False
 
+_STYLE_SET = False
+
 
 REQUIRED_COLUMNS = [
 	"Match No.",
@@ -53,6 +57,14 @@ class Weights:
 	WMRO: float = -2.0
 	WDH: float = 2.0
 
+	@cached_property
+	def vec(self) -> np.ndarray:
+		"""Weights as a vector in count-column order, built once per instance."""
+		return np.array(
+			[self.WCP, self.WGT, self.WC, self.WDC, self.WST, self.WRO, self.WMRO, self.WDH],
+			dtype=np.float64,
+		)
+
 
 def load_csv(path: str) -> pd.DataFrame:
 	if not os.path.exists(path):
@@ -65,56 +77,57 @@ def load_csv(path: str) -> pd.DataFrame:
 
 
 def compute_matrix(df: pd.DataFrame, weights: Weights) -> pd.DataFrame:
-	working = df.copy()
-	for col in ["Pick", "Throw", "Short Description"]:
-		working[col] = working[col].fillna("").str.strip().str.lower()
-
-	group = working.groupby("Player Name")
-	matrix = pd.DataFrame(index=group.size().index)
-	matrix.index.name = "Player Name"
-
-	matrix["CP"] = group.apply(lambda g: (g["Pick"] == "clean pick").sum())
-	matrix["GT"] = group.apply(lambda g: (g["Pick"] == "good throw").sum())
-	matrix["C"] = group.apply(lambda g: (g["Pick"] == "catch").sum())
-	matrix["DC"] = group.apply(lambda g: (g["Pick"] == "drop catch").sum())
-	matrix["ST"] = group.apply(lambda g: (g["Throw"] == "stumping").sum())
-	matrix["RO"] = group.apply(lambda g: (g["Throw"] == "run out").sum())
-	matrix["MRO"] = group.apply(lambda g: (g["Throw"] == "missed run out").sum())
-	matrix["DH"] = group.apply(lambda g: g["Short Description"].str.contains("direct hit").sum())
-	matrix["RS"] = group["Runs"].sum()
-
-	matrix["PS"] = (
-		matrix["CP"] * weights.WCP
-		+ matrix["GT"] * weights.WGT
-		+ matrix["C"] * weights.WC
-		+ matrix["DC"] * weights.WDC
-		+ matrix["ST"] * weights.WST
-		+ matrix["RO"] * weights.WRO
-		+ matrix["MRO"] * weights.WMRO
-		+ matrix["DH"] * weights.WDH
-		+ matrix["RS"]
+	pick = df["Pick"].fillna("").str.strip().str.lower().astype("category")
+	throw = df["Throw"].fillna("").str.strip().str.lower().astype("category")
+	desc = df["Short Description"].fillna("").str.lower()
+	player = df["Player Name"].astype("category")
+
+	# Comparisons on the categorical columns run against integer codes.
+	masks = pd.DataFrame(
+		{
+			"CP": pick.eq("clean pick"),
+			"GT": pick.eq("good throw"),
+			"C": pick.eq("catch"),
+			"DC": pick.eq("drop catch"),
+			"ST": throw.eq("stumping"),
+			"RO": throw.eq("run out"),
+			"MRO": throw.eq("missed run out"),
+			"DH": desc.str.contains("direct hit", regex=False, na=False).to_numpy(dtype=np.bool_),
+			"RS": df["Runs"].to_numpy(),
+		},
+		index=df.index,
 	)
+	# One grouped reduction for every column. sort=False keeps players in order
+	# of first appearance; sort on "Player Name" afterwards if needed.
+	matrix = masks.groupby(player, sort=False, observed=True).sum()
+	matrix.index = matrix.index.astype(matrix.index.categories.dtype)
+
+	count_cols = ["CP", "GT", "C", "DC", "ST", "RO", "MRO", "DH"]
+	matrix[count_cols] = matrix[count_cols].astype(int)
+	matrix["PS"] = matrix[count_cols].to_numpy() @ weights.vec + matrix["RS"].to_numpy()
 	return matrix.reset_index()
 
 
 def save_outputs(matrix: pd.DataFrame, outdir: str) -> None:
 	os.makedirs(outdir, exist_ok=True)
-	matrix.to_csv(os.path.join(outdir, "performance_matrix.csv"), index=False)
+	matrix.to_csv(os.path.join(outdir, "performance_matrix.csv"), index=False, chunksize=65536, lineterminator="\n")
 	try:
-		matrix.to_excel(os.path.join(outdir, "performance_matrix.xlsx"), index=False)
+		matrix.to_excel(os.path.join(outdir, "performance_matrix.xlsx"), index=False, engine="xlsxwriter")
 	except Exception as e:
-		print("Warning: Excel export failed (install openpyxl).", e)
+		print("Warning: Excel export failed (install xlsxwriter).", e)
 
 
 def maybe_plot(matrix: pd.DataFrame, outdir: str) -> Optional[str]:
+	global _STYLE_SET
 	if not _HAS_PLOTTING:
 		return None
-	sns.set(style="whitegrid")
+	# Apply the seaborn theme once; repeated calls would rewrite rcParams each time
+	if not _STYLE_SET:
+		sns.set_theme(style="whitegrid")
+		_STYLE_SET = True
 	fig, ax = plt.subplots(figsize=(8, 5))
 	sns.barplot(data=matrix, x="Player Name", y="PS", ax=ax, legend=False)
-	for p in ax.patches:
-		height = p.get_height()
-		ax.annotate(f"{height:.1f}", (p.get_x() + p.get_width()/2, height), ha="center", va="bottom", fontsize=9)
+	ax.bar_label(ax.containers[0], fmt="%.1f", padding=2, fontsize=9)
 	plt.title("Fielding Performance Score (PS)")
 	plt.tight_layout()
 	path = os.path.join(outdir, "performance_ps_chart.png")
@@ -8,24 +8,27 @@ Creates a multi-sheet workbook:
 
 from __future__ import annotations
 
-from typing import Dict
+from itertools import zip_longest
+from typing import Dict, List, Sequence
 
 import pandas as pd
-from openpyxl.utils import get_column_letter
-from openpyxl.styles import Alignment, Font, PatternFill
 
 
-def _autosize(ws) -> None:
-	for col in ws.columns:
-		max_length = 0
-		col_letter = get_column_letter(col[0].column)
-		for cell in col:
-			try:
-				value_len = len(str(cell.value)) if cell.value is not None else 0
-				max_length = max(max_length, value_len)
-			except Exception:
-				pass
-		ws.column_dimensions[col_letter].width = min(max_length + 2, 40)
+def _text_widths(df: pd.DataFrame, header: bool = True) -> List[int]:
+	"""Longest text length per column of `df`, computed column-wise in pandas."""
+	cells = df.astype(str).where(df.notna(), "")
+	# Reduce per column explicitly: on a zero-row frame apply() would not reduce.
+	widths = [int(cells[c].str.len().max()) if len(cells) else 0 for c in cells.columns]
+	if header:
+		widths = [max(w, len(str(c))) for w, c in zip(widths, df.columns)]
+	return widths
+
+
+def _autosize(ws, *width_lists: Sequence[int]) -> None:
+	"""Size columns from precomputed text widths instead of visiting every cell."""
+	widths = [max(col) for col in zip_longest(*width_lists, fillvalue=0)]
+	for idx, width in enumerate(widths):
+		ws.set_column(idx, idx, min(width + 2, 40))
 
 
 def _build_pretty_matrix(summary_df: pd.DataFrame) -> pd.DataFrame:
@@ -58,58 +61,55 @@ def _write_calculations_sheet(writer, summary_df: pd.DataFrame, weights_obj) ->
 		"Where W are weights and RS is added directly.",
 	]})
 	calc_df.to_excel(writer, index=False, header=False, sheet_name=ws_name, startrow=0)
-	ws = writer.book[ws_name]
-	row = 4
-	for player, rowvals in summary_df.iterrows():
-		cp, gt, c, dc, st, ro, mro, dh, rs, ps = (
-			rowvals["CP"], rowvals["GT"], rowvals["C"], rowvals["DC"], rowvals["ST"],
-			rowvals["RO"], rowvals["MRO"], rowvals["DH"], rowvals["RS"], rowvals["PS"],
-		)
+	ws = writer.sheets[ws_name]
+	col_a_width = max(_text_widths(calc_df, header=False))
+	row = 3
+	# Plain ndarray rows avoid boxing each player's values into a Series
+	arr = summary_df[["CP", "GT", "C", "DC", "ST", "RO", "MRO", "DH", "RS", "PS"]].to_numpy()
+	for i, player in enumerate(summary_df.index):
+		cp, gt, c, dc, st, ro, mro, dh, rs, ps = arr[i]
 		expr = (
 			f"PS=({cp}×{weights_obj.WCP})+({gt}×{weights_obj.WGT})+({c}×{weights_obj.WC})+"
 			f"({dc}×{weights_obj.WDC})+({st}×{weights_obj.WST})+({ro}×{weights_obj.WRO})+"
 			f"({mro}×{weights_obj.WMRO})+({dh}×{weights_obj.WDH})+{rs}"
 		)
-		ws.cell(row=row, column=1, value=player)
-		ws.cell(row=row + 1, column=1, value=expr)
-		ws.cell(row=row + 2, column=1, value=f"PS={ps}")
+		ws.write(row, 0, player)
+		ws.write(row + 1, 0, expr)
+		ws.write(row + 2, 0, f"PS={ps}")
+		col_a_width = max(col_a_width, len(str(player)), len(expr), len(f"PS={ps}"))
 		row += 4
-	_autosize(ws)
+	_autosize(ws, [col_a_width])
 
 
 def create_excel_report(ball_by_ball: pd.DataFrame, summary_df: pd.DataFrame, weights_obj, output_path: str) -> None:
 	"""Write a formatted Excel report to the given path."""
-	with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
+	with pd.ExcelWriter(output_path, engine="xlsxwriter") as writer:
 
 		# Sheet 1: Ball-by-Ball with legend header band (like sample)
 		ball_by_ball.to_excel(writer, index=False, sheet_name="Ball-by-Ball", startrow=5)
-		ws1 = writer.book["Ball-by-Ball"]
+		ws1 = writer.sheets["Ball-by-Ball"]
 		# Legend rows
-		head_fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-		bold = Font(bold=True)
+		legend_fmt = writer.book.add_format({"bold": True, "align": "left", "bg_color": "#D9E1F2", "pattern": 1})
 		legend_rows = [
 			["Pick", "Y->", "Clean Pick", "N->", "Fumble", "C->", "Catch", "DC->", "Dropped Catch"],
 			["Throw", "Y->", "Good Throw", "N->", "Bad throw", "RO->", "Run Out", "MR->", "Missed Runout", "ST->", "Stumping"],
 			["Runs", "Use '+' for runs saved, '-' for conceded"],
 		]
-		for r_idx, row_vals in enumerate(legend_rows, start=1):
-			for c_idx, val in enumerate(row_vals, start=1):
-				cell = ws1.cell(row=r_idx, column=c_idx, value=val)
-				cell.font = bold
-				cell.alignment = Alignment(horizontal="left")
-				cell.fill = head_fill
+		for r_idx, row_vals in enumerate(legend_rows):
+			ws1.write_row(r_idx, 0, row_vals, legend_fmt)
 		# Freeze panes below legend and column headers
-		ws1.freeze_panes = "A7"
-		_autosize(ws1)
+		ws1.freeze_panes(6, 0)
+		_autosize(ws1, _text_widths(pd.DataFrame(legend_rows), header=False), _text_widths(ball_by_ball))
 
 		# Sheet 2: Performance Matrix (counts + PS)
 		matrix = summary_df.copy()
 		matrix.index.name = "Player Name"
 		pretty = _build_pretty_matrix(matrix)
-		pretty.reset_index().to_excel(writer, index=False, sheet_name="Performance Matrix")
-		ws2 = writer.book["Performance Matrix"]
-		_autosize(ws2)
-		ws2.freeze_panes = "A2"
+		pretty = pretty.reset_index()
+		pretty.to_excel(writer, index=False, sheet_name="Performance Matrix")
+		ws2 = writer.sheets["Performance Matrix"]
+		_autosize(ws2, _text_widths(pretty))
+		ws2.freeze_panes(1, 0)
 
 		# Sheet 3: Weights & Formula
 		weights_dict: Dict[str, float] = {
@@ -124,18 +124,14 @@ def create_excel_report(ball_by_ball: pd.DataFrame, summary_df: pd.DataFrame, we
 		}
 		weights_df = pd.DataFrame({"Weight": list(weights_dict.keys()), "Value": list(weights_dict.values())})
 		weights_df.to_excel(writer, index=False, sheet_name="Weights & Formula", startrow=0)
-		ws3 = writer.book["Weights & Formula"]
+		ws3 = writer.sheets["Weights & Formula"]
 		# Add formula text
-		start_row = len(weights_df) + 3
-		ws3.cell(row=start_row, column=1, value="PS Formula:")
-		ws3.cell(
-			row=start_row + 1,
-			column=1,
-			value="PS = (CP×WCP) + (GT×WGT) + (C×WC) + (DC×WDC) + (ST×WST) + (RO×WRO) + (MRO×WMRO) + (DH×WDH) + RS",
-		)
-		ws3["A1"].font = Font(bold=True)
-		ws3["A1"].alignment = Alignment(horizontal="left")
-		_autosize(ws3)
+		start_row = len(weights_df) + 2
+		formula = "PS = (CP×WCP) + (GT×WGT) + (C×WC) + (DC×WDC) + (ST×WST) + (RO×WRO) + (MRO×WMRO) + (DH×WDH) + RS"
+		ws3.write(start_row, 0, "PS Formula:")
+		ws3.write(start_row + 1, 0, formula)
+		ws3.write(0, 0, weights_df.columns[0], writer.book.add_format({"bold": True, "align": "left"}))
+		_autosize(ws3, _text_widths(weights_df), [len(formula)])
 
 		# Sheet 4: Calculations (per-player expansion)
 		_write_calculations_sheet(writer, matrix, weights_obj)
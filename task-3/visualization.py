@@ -2,48 +2,319 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import base64
+import functools
+import io
+import math
+import os
+from multiprocessing import Pool
+from typing import TYPE_CHECKING, BinaryIO, Iterable, List, Literal, Optional, Union
 
-import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
 import pandas as pd
 
+if TYPE_CHECKING:
+	from matplotlib.axes import Axes
+	from matplotlib.figure import Figure
 
-def plot_ps_bar(summary_df: pd.DataFrame, output_path: Optional[str] = None) -> plt.Figure:
+# pyplot is slow to import, so it is loaded on first plot
+_plt = None
+_mpl_checked = False
+
+
+def _check_matplotlib() -> None:
+	"""Reject matplotlib 3.3.0, whose tick handling made plotting very slow."""
+	global _mpl_checked
+	if not _mpl_checked:
+		import matplotlib
+
+		if matplotlib.__version__ == "3.3.0":
+			raise RuntimeError("matplotlib 3.3.0 has a plotting performance regression; upgrade to >=3.3.3")
+		_mpl_checked = True
+
+
+def _pyplot():
+	"""Return matplotlib.pyplot, importing it on the first call."""
+	global _plt
+	if _plt is None:
+		import matplotlib.pyplot as plt
+		_plt = plt
+	return _plt
+
+
+@functools.lru_cache(maxsize=32)
+def _viridis(n: int) -> np.ndarray:
+	"""RGBA viridis colors for `n` bars, cached per bar count (read-only)."""
+	from matplotlib import colormaps
+
+	colors = colormaps["viridis"](np.linspace(0, 1, n))
+	colors.flags.writeable = False
+	return colors
+
+
+# Renderer settings applied while saving: simplify paths before rasterizing
+# and draw long paths in chunks. Near-free for bars, and it keeps rendering
+# cheap if dense line plots are added to these figures.
+_SAVE_RC = {"path.simplify": True, "path.simplify_threshold": 1.0, "agg.path.chunksize": 10000}
+
+# Above this many bars SVG output gets slower to write than a fast PNG
+_SVG_MAX_BARS = 200
+
+
+def _resolve_format(output_path: Union[str, BinaryIO], format: Optional[str], n_bars: int) -> str:
+	"""Pick the output format: explicit argument, then file suffix, then by size.
+
+	Buffers have no suffix and default to PNG.
+	"""
+	if format:
+		return format.lower().lstrip(".")
+	if not isinstance(output_path, (str, os.PathLike)):
+		return "png"
+	ext = os.path.splitext(output_path)[1].lower().lstrip(".")
+	if ext:
+		return ext
+	return "svg" if n_bars <= _SVG_MAX_BARS else "png"
+
+
+def _zopfli_optimize(png: bytes) -> bytes:
+	"""Losslessly recompress PNG bytes with zopflipng, if it is installed."""
+	try:
+		from zopflipng import png_optimize  # optional
+	except ImportError:
+		return png
+	result, code = png_optimize(png, num_iterations=15)
+	return result if code == 0 else png
+
+
+def _save_figure(
+	fig: Figure,
+	output_path: Union[str, BinaryIO],
+	fmt: str,
+	compress_level: int,
+	optimize: Optional[str] = "fast",
+) -> None:
+	"""Save `fig` with settings suited to the format."""
+	from matplotlib import rc_context
+
+	with rc_context(_SAVE_RC):
+		if fmt in {"jpg", "jpeg"}:
+			fig.savefig(output_path, format=fmt, dpi=150, pil_kwargs={"quality": 85, "optimize": False})
+		elif fmt == "png" and optimize == "archive":
+			buf = io.BytesIO()
+			fig.savefig(buf, format=fmt, dpi=150, pil_kwargs={"compress_level": compress_level})
+			data = _zopfli_optimize(buf.getvalue())
+			if isinstance(output_path, (str, os.PathLike)):
+				with open(output_path, "wb") as f:
+					f.write(data)
+			else:
+				output_path.write(data)
+		elif fmt == "png" and optimize == "fast":
+			fig.savefig(output_path, format=fmt, dpi=150, pil_kwargs={"compress_level": compress_level})
+		elif fmt == "svg":
+			fig.savefig(output_path, format=fmt, bbox_inches="tight")
+		else:
+			fig.savefig(output_path, format=fmt, dpi=150)
+
+
+def _new_figure(figsize, save_only: bool, **subplot_kw):
+	"""Create (fig, axes). Save-only figures use an Agg canvas outside pyplot.
+
+	Constrained layout is set up front, so no separate tight_layout pass is
+	needed before saving.
+	"""
+	if save_only:
+		from matplotlib.backends.backend_agg import FigureCanvasAgg
+		from matplotlib.figure import Figure
+
+		fig = Figure(figsize=figsize, layout="constrained")
+		FigureCanvasAgg(fig)
+		return fig, fig.subplots(**subplot_kw)
+	return _pyplot().subplots(figsize=figsize, layout="constrained", **subplot_kw)
+
+
+def plot_ps_bar(
+	summary_df: pd.DataFrame,
+	output_path: Optional[Union[str, BinaryIO]] = None,
+	compress_level: int = 1,
+	format: Optional[str] = None,
+	ax: Optional[Axes] = None,
+	rotation: Optional[float] = None,
+	optimize: Literal["fast", "archive", None] = "fast",
+	return_figure: bool = True,
+	top_k: Optional[int] = None,
+) -> Optional[Figure]:
 	"""Create a bar chart comparing players' Performance Scores (PS).
 
 	Parameters
 	----------
 	summary_df : pd.DataFrame
 		DataFrame with index as player names and a 'PS' column.
-	output_path : Optional[str]
-		If provided, saves the figure to this path (PNG recommended).
+	output_path : Optional[Union[str, BinaryIO]]
+		If provided, saves the figure to this path or writable binary buffer
+		(e.g. ``io.BytesIO`` for serving without touching disk). For paths
+		the format follows the file suffix; without one, small charts are
+		saved as SVG and charts with more than 200 bars as PNG. Buffers
+		default to PNG.
+	compress_level : int
+		zlib level (0-9) for PNG output. PNG is lossless at every level; low
+		levels encode much faster for slightly larger files.
+	format : Optional[str]
+		Explicit output format (e.g. "svg", "png", "jpg"), overriding the suffix.
+	ax : Optional[matplotlib.axes.Axes]
+		Axes to draw into; it is cleared first. Reusing one Axes across many
+		charts avoids creating a new figure each time. When omitted and
+		`output_path` is given, the figure is rendered on an Agg canvas
+		outside pyplot, so no GUI backend is initialised. Otherwise a pyplot
+		figure is created and stays open until closed with ``plt.close(fig)``.
+	rotation : Optional[float]
+		Angle for the player tick labels. Tick labels are left untouched
+		unless this is given.
+	optimize : {"fast", "archive", None}
+		PNG speed/size trade-off. "fast" encodes at `compress_level`;
+		"archive" additionally recompresses the file with zopflipng (when
+		installed) for charts that are written once and kept; None uses
+		matplotlib's default PNG settings.
+	return_figure : bool
+		If False, a figure created here is closed after saving and None is
+		returned, so fire-and-forget saves in a loop do not keep figures
+		alive. Figures owning a caller-supplied `ax` are never closed.
+	top_k : Optional[int]
+		If given, plot only the `top_k` players with the highest PS, in
+		descending order. Keeps long summaries readable and cuts the number
+		of bars, labels and ticks to lay out.
 
 	Returns
 	-------
-	matplotlib.figure.Figure
-		The created figure.
+	Optional[matplotlib.figure.Figure]
+		The figure that was drawn on, or None when `return_figure` is False.
 	"""
-	sns.set(style="whitegrid")
-	fig, ax = plt.subplots(figsize=(8, 5))
+	_check_matplotlib()
+	if top_k is not None:
+		summary_df = summary_df.nlargest(top_k, "PS")
+	owns_figure = ax is None
+	if owns_figure:
+		fig, ax = _new_figure((8, 5), save_only=bool(output_path))
+	else:
+		ax.clear()
+		fig = ax.figure
 
-	data = summary_df.reset_index().rename(columns={"index": "Player Name"})
-	sns.barplot(data=data, x="Player Name", y="PS", ax=ax, palette="viridis")
+	players = summary_df.index.to_numpy()
+	ps = summary_df["PS"].to_numpy()
+	bars = ax.bar(players, ps, color=_viridis(len(ps)))
+	ax.grid(True, axis="y", linestyle="-", alpha=0.3)
+	ax.set_axisbelow(True)
 	ax.set_title("Fielding Performance Score (PS) by Player")
 	ax.set_xlabel("Player")
 	ax.set_ylabel("Performance Score (PS)")
-	for p in ax.patches:
-		height = p.get_height()
-		ax.annotate(f"{height:.1f}", (p.get_x() + p.get_width() / 2, height),
-					 ha="center", va="bottom", fontsize=9)
+	if rotation is not None:
+		ax.tick_params(axis="x", labelrotation=rotation)
+	ax.bar_label(bars, fmt="%.1f", padding=2, fontsize=9)
+
+	if output_path:
+		_save_figure(fig, output_path, _resolve_format(output_path, format, len(summary_df)), compress_level, optimize)
+	if return_figure:
+		return fig
+	# Agg-only figures are freed with the last reference; pyplot ones must be closed.
+	if owns_figure and fig.canvas.manager is not None:
+		_pyplot().close(fig)
+	return None
+
+
+def plot_ps_bar_b64(summary_df: pd.DataFrame, compress_level: int = 1) -> str:
+	"""Render the PS bar chart to an in-memory PNG and return it base64-encoded.
+
+	Suitable for embedding in JSON/HTML responses.
+	"""
+	buf = io.BytesIO()
+	plot_ps_bar(summary_df, buf, compress_level=compress_level, format="png")
+	return base64.b64encode(buf.getvalue()).decode()
+
+
+def _init_plot_worker() -> None:
+	"""Pool initializer: force the headless Agg backend in each worker."""
+	import matplotlib
+
+	matplotlib.use("Agg")
+
+
+def _plot_worker(job) -> str:
+	summary_df, output_path = job
+	plot_ps_bar(summary_df, output_path, return_figure=False)
+	return output_path
+
+
+def plot_ps_bar_batch(
+	summary_dfs: Iterable[pd.DataFrame],
+	output_paths: Iterable[str],
+	processes: Optional[int] = None,
+) -> List[str]:
+	"""Save one PS bar chart per summary DataFrame, rendering in parallel.
+
+	Charts are rendered in a process pool (one process per CPU by default),
+	since much of figure setup is pure Python and holds the GIL. Only the
+	output paths are returned; figures stay in the worker processes.
+	"""
+	jobs = list(zip(summary_dfs, output_paths))
+	with Pool(processes, initializer=_init_plot_worker) as pool:
+		return pool.map(_plot_worker, jobs)
+
+
+def plot_ps_grid(
+	summary_df: pd.DataFrame,
+	ncols: int = 4,
+	output_path: Optional[str] = None,
+	compress_level: int = 1,
+) -> Figure:
+	"""Draw every player's PS as one panel of a single multi-panel figure.
+
+	Rendering all players into one figure and saving it once is much cheaper
+	than calling `plot_ps_bar` per player.
+
+	Parameters
+	----------
+	summary_df : pd.DataFrame
+		DataFrame with index as player names and a 'PS' column.
+	ncols : int
+		Number of panels per row.
+	output_path : Optional[str]
+		If provided, saves the figure to this path (format chosen as in
+		`plot_ps_bar`).
+	compress_level : int
+		zlib level (0-9) for PNG output.
+
+	Returns
+	-------
+	matplotlib.figure.Figure
+		The created figure.
+	"""
+	_check_matplotlib()
+	players = summary_df.index.to_numpy()
+	ps = summary_df["PS"].to_numpy()
+	nrows = max(math.ceil(len(ps) / ncols), 1)
+	fig, axes = _new_figure(
+		(4 * ncols, 3 * nrows), save_only=bool(output_path), nrows=nrows, ncols=ncols, sharey=True, squeeze=False
+	)
+	colors = _viridis(len(ps))
+
+	for i, ax in enumerate(axes.flat):
+		if i >= len(ps):
+			ax.set_axis_off()
+			continue
+		bars = ax.bar([players[i]], [ps[i]], color=[colors[i]])
+		ax.grid(True, axis="y", linestyle="-", alpha=0.3)
+		ax.set_axisbelow(True)
+		ax.set_title(str(players[i]))
+		ax.set_xticks([])
+		ax.margins(y=0.12)
+		ax.bar_label(bars, fmt="%.1f", padding=2, fontsize=9)
 
-	plt.tight_layout()
+	fig.suptitle("Fielding Performance Score (PS) by Player")
 	if output_path:
-		fig.savefig(output_path, dpi=150)
+		_save_figure(fig, output_path, _resolve_format(output_path, None, len(ps)), compress_level)
 	return fig
 
 
-__all__ = ["plot_ps_bar"]
+__all__ = ["plot_ps_bar", "plot_ps_bar_b64", "plot_ps_bar_batch", "plot_ps_grid"]
 
 
 